@@ -1,8 +1,17 @@
 """Agent sub-package for the Agentic Game-Builder AI."""
 
-from agents.clarifier import run_clarifier
-from agents.planner import run_planner
-from agents.executor import run_executor
-from agents.validator import run_validator
+from agents.clarifier import arun_clarifier, run_clarifier
+from agents.planner import arun_planner, run_planner
+from agents.executor import arun_executor, run_executor
+from agents.validator import arun_validator, run_validator
 
-__all__ = ["run_clarifier", "run_planner", "run_executor", "run_validator"]
+__all__ = [
+    "run_clarifier",
+    "run_planner",
+    "run_executor",
+    "run_validator",
+    "arun_clarifier",
+    "arun_planner",
+    "arun_executor",
+    "arun_validator",
+]
@@ -6,15 +6,23 @@ smart clarification questions.  Returns structured JSON with requirements
 and optional questions for the interactive loop in main.py.
 """
 
-import json
 import logging
 from typing import Dict
 
+import orjson
+
 from prompts.agent_prompts import CLARIFIER_PROMPT
-from utils.api_helpers import call_llm
+from utils.api_helpers import acall_llm, call_llm
+from utils.json_extract import extract_first_json
+from utils.parsing import strip_fences
 
 logger = logging.getLogger(__name__)
 
+# Most recent history messages included in the prompt (4 Q/A pairs).
+# Older turns are summarised by the requirements dict itself, which the
+# clarifier keeps updated, so prompt size stays bounded per turn.
+_HISTORY_WINDOW = 8
+
 
 def run_clarifier(state) -> Dict:
     """
@@ -30,28 +38,48 @@ def run_clarifier(state) -> Dict:
     dict
         ``{"is_complete": bool, "questions": [...], "requirements": {...}}``
     """
-    # Build user message with all context so far
+    raw_response = call_llm(
+        agent_name="clarifier",
+        system_prompt=CLARIFIER_PROMPT,
+        user_message=_build_user_message(state),
+    )
+    return _finish(raw_response)
+
+
+async def arun_clarifier(state) -> Dict:
+    """Async variant of :func:`run_clarifier` — awaits the LLM call."""
+    raw_response = await acall_llm(
+        agent_name="clarifier",
+        system_prompt=CLARIFIER_PROMPT,
+        user_message=_build_user_message(state),
+    )
+    return _finish(raw_response)
+
+
+def _build_user_message(state) -> str:
+    """Assemble the user message with all context gathered so far."""
     parts = [f"Game idea: {state.user_input}"]
 
-    if state.conversation_history:
+    if state.history_contents:
+        roles = state.history_roles
+        contents = state.history_contents
+        dropped = len(contents) - _HISTORY_WINDOW
         parts.append("\nPrevious conversation:")
-        for msg in state.conversation_history:
-            role = msg["role"].capitalize()
-            parts.append(f"  {role}: {msg['content']}")
+        if dropped > 0:
+            parts.append(f"  (… {dropped} earlier message(s) omitted …)")
+            roles = roles[-_HISTORY_WINDOW:]
+            contents = contents[-_HISTORY_WINDOW:]
+        for role, content in zip(roles, contents):
+            parts.append(f"  {('Assistant', 'User')[role]}: {content}")
 
     if state.requirements:
-        parts.append(f"\nCurrent requirements (partial): {json.dumps(state.requirements)}")
+        parts.append(f"\nCurrent requirements (partial): {orjson.dumps(state.requirements).decode()}")
 
-    user_message = "\n".join(parts)
+    return "\n".join(parts)
 
-    # Call the LLM
-    raw_response = call_llm(
-        agent_name="clarifier",
-        system_prompt=CLARIFIER_PROMPT,
-        user_message=user_message,
-    )
 
-    # Parse JSON response
+def _finish(raw_response: str) -> Dict:
+    """Parse the raw LLM response and log the outcome."""
     result = _parse_clarifier_response(raw_response)
     logger.info(
         "Clarifier result — complete=%s, questions=%d",
@@ -69,35 +97,29 @@ def _parse_clarifier_response(raw: str) -> Dict:
     text = raw.strip()
 
     # Strip markdown fences if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first and last fence lines
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines)
+    text = strip_fences(text)
 
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        # Try to find JSON object in the response
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start != -1 and end > start:
-            try:
-                data = json.loads(text[start:end])
-            except json.JSONDecodeError:
-                logger.error("Failed to parse Clarifier response as JSON.")
-                return {
-                    "is_complete": False,
-                    "questions": ["Could you describe your game idea in more detail?"],
-                    "requirements": None,
-                }
-        else:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Fall back to the first balanced JSON object in the response
+        candidate = extract_first_json(text)
+        if candidate is None:
             logger.error("No JSON object found in Clarifier response.")
             return {
                 "is_complete": False,
                 "questions": ["Could you describe your game idea in more detail?"],
                 "requirements": None,
             }
+        try:
+            data = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            logger.error("Failed to parse Clarifier response as JSON.")
+            return {
+                "is_complete": False,
+                "questions": ["Could you describe your game idea in more detail?"],
+                "requirements": None,
+            }
 
     # Normalise
     return {
@@ -12,24 +12,38 @@ import logging
 import re
 from typing import Dict
 
-import json
+import orjson
 
 from prompts.agent_prompts import EXECUTOR_PROMPT
-from utils.api_helpers import call_llm
+from utils.api_helpers import acall_llm_stream, call_llm
+from utils.validation import iter_code_blocks
 
 logger = logging.getLogger(__name__)
 
-# Robust regex for fenced-code-block extraction (NEVER simple .split)
-_CODE_BLOCK_RE = re.compile(
-    r"```(?:html|css|javascript|js)?\s*\n(.*?)```",
-    re.DOTALL | re.IGNORECASE,
-)
-
+# Robust regex for language-tagged block extraction (NEVER simple .split);
+# untagged blocks go through utils.validation.iter_code_blocks.
+# The body class ([^`] or a backtick not opening a closing fence) keeps
+# matching linear — important here because the streaming path re-runs
+# this regex over the growing buffer, which always ends in an unmatched
+# open fence while a block is mid-stream.
 _LANG_TAG_RE = re.compile(
-    r"```(html|css|javascript|js)\s*\n(.*?)```",
-    re.DOTALL | re.IGNORECASE,
+    r"```(html|css|javascript|js)[ \t]*\n((?:[^`]|`(?!``))*)```",
+    re.IGNORECASE,
 )
 
+# Content signatures for classifying untagged code blocks — compiled
+# once instead of chaining per-call substring tests.
+_HTML_SIG = re.compile(r"<!DOCTYPE|<html", re.IGNORECASE)
+_CSS_SIG = re.compile(r"\b(?:margin|padding|body|canvas)\b")
+_JS_SIG = re.compile(r"\bfunction\b|\b(?:const|var|class)\s")
+
+_LANG_TO_FILE = {
+    "html": "index.html",
+    "css": "style.css",
+    "javascript": "game.js",
+    "js": "game.js",
+}
+
 
 def run_executor(state) -> Dict[str, str]:
     """
@@ -45,6 +59,60 @@ def run_executor(state) -> Dict[str, str]:
     dict
         ``{"index.html": "…", "style.css": "…", "game.js": "…"}``
     """
+    raw_response = call_llm(
+        agent_name="executor",
+        system_prompt=EXECUTOR_PROMPT,
+        user_message=_build_user_message(state),
+    )
+    return _finish(raw_response)
+
+
+async def arun_executor(state, on_chunk=None) -> Dict[str, str]:
+    """
+    Async variant of :func:`run_executor` — streams the response.
+
+    Each completed fenced block is published to ``state.generated_files``
+    while the rest of the response is still decoding, so downstream work
+    (structural checks, file writes, UI) can start before the final
+    token arrives.  The returned dict comes from a full parse of the
+    finished response and is authoritative.
+    """
+    buffer: list[str] = []
+    published: Dict[str, str] = {}
+
+    def _consume(delta: str):
+        buffer.append(delta)
+        _publish_completed_blocks("".join(buffer), published, state)
+        if on_chunk is not None:
+            on_chunk(delta)
+
+    raw_response = await acall_llm_stream(
+        agent_name="executor",
+        system_prompt=EXECUTOR_PROMPT,
+        user_message=_build_user_message(state),
+        on_chunk=_consume,
+    )
+    return _finish(raw_response)
+
+
+def _publish_completed_blocks(partial: str, published: Dict[str, str], state):
+    """Extract any newly closed language-tagged blocks from the stream buffer."""
+    for m in _LANG_TAG_RE.finditer(partial):
+        filename = _LANG_TO_FILE.get(m.group(1).lower())
+        if filename and filename not in published:
+            published[filename] = _slice_stripped(partial, m.start(2), m.end(2))
+            state.generated_files[filename] = published[filename]
+            logger.info(
+                "%s complete after %d chars streamed.", filename, len(partial)
+            )
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _build_user_message(state) -> str:
+    """Build the executor prompt from the plan plus any prior issues."""
     plan_text = _format_plan(state.game_plan)
 
     # Include validation issues from previous attempt if retrying
@@ -58,14 +126,11 @@ def run_executor(state) -> Dict[str, str]:
                 + "\n".join(f"- {i}" for i in issues)
             )
 
-    user_message = f"Game Plan:\n\n{plan_text}{extra}"
+    return f"Game Plan:\n\n{plan_text}{extra}"
 
-    raw_response = call_llm(
-        agent_name="executor",
-        system_prompt=EXECUTOR_PROMPT,
-        user_message=user_message,
-    )
 
+def _finish(raw_response: str) -> Dict[str, str]:
+    """Parse the raw LLM response into files and log the outcome."""
     files = _parse_executor_response(raw_response)
     logger.info(
         "Executor produced %d file(s): %s",
@@ -74,19 +139,69 @@ def run_executor(state) -> Dict[str, str]:
     )
     return files
 
+# The plan dict is identical across executor retries, so the multi-KB
+# serialisation is done once and reused.  Holding a reference to the
+# plan itself (rather than its id) makes the identity check safe.
+_plan_cache: tuple[dict, str] | None = None
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
 
 def _format_plan(plan: dict | None) -> str:
     """Serialise the game plan dict into JSON for the prompt."""
+    global _plan_cache
     if not plan:
         return "No plan available."
+    if _plan_cache is not None and _plan_cache[0] is plan:
+        return _plan_cache[1]
     try:
-        return json.dumps(plan, indent=2, ensure_ascii=False)
+        # orjson never escapes non-ASCII, matching the previous
+        # ensure_ascii=False output.
+        text = orjson.dumps(plan, option=orjson.OPT_INDENT_2).decode()
     except Exception:
-        return str(plan)
+        text = str(plan)
+    _plan_cache = (plan, text)
+    return text
+
+
+def _slice_stripped(raw: str, start: int, end: int) -> str:
+    """
+    Materialise ``raw[start:end]`` with surrounding whitespace trimmed.
+
+    Trimming by advancing the indices first means each (potentially
+    multi-KB) block is copied out of the response exactly once, instead
+    of slice-then-strip allocating twice.
+    """
+    while start < end and raw[start].isspace():
+        start += 1
+    while end > start and raw[end - 1].isspace():
+        end -= 1
+    return raw[start:end]
+
+
+def _classify_untagged(block: str) -> str | None:
+    """
+    Map an untagged (non-empty, stripped) block to a filename.
+
+    The first character usually disambiguates the language, so it is
+    used as a cheap dispatch that runs at most one signature regex; only
+    genuinely ambiguous openers fall through to the full chain.
+    """
+    first = block[0]
+    if first == "<":
+        # Markup — only the HTML signature can apply.
+        return "index.html" if _HTML_SIG.search(block) else None
+    if first in "{.#@":
+        # Selector / at-rule openers — CSS territory.
+        if "{" in block and _CSS_SIG.search(block):
+            return "style.css"
+        return None
+    # Identifiers, keywords, '(' … most likely JS; try it first.
+    if _JS_SIG.search(block):
+        return "game.js"
+    if _HTML_SIG.search(block):
+        return "index.html"
+    if "{" in block and _CSS_SIG.search(block):
+        return "style.css"
+    return None
 
 
 def _parse_executor_response(raw: str) -> Dict[str, str]:
@@ -97,30 +212,24 @@ def _parse_executor_response(raw: str) -> Dict[str, str]:
     files: Dict[str, str] = {}
 
     # Try language-tagged blocks first
-    tagged_blocks = _LANG_TAG_RE.findall(raw)
-    if tagged_blocks:
-        for lang, content in tagged_blocks:
-            lang = lang.lower().strip()
-            if lang == "html" and "index.html" not in files:
-                files["index.html"] = content.strip()
-            elif lang == "css" and "style.css" not in files:
-                files["style.css"] = content.strip()
-            elif lang in ("javascript", "js") and "game.js" not in files:
-                files["game.js"] = content.strip()
-
-    # If we're still missing files, try untagged blocks and infer by content
+    for m in _LANG_TAG_RE.finditer(raw):
+        filename = _LANG_TO_FILE.get(m.group(1).lower())
+        if filename and filename not in files:
+            files[filename] = _slice_stripped(raw, m.start(2), m.end(2))
+
+    # If we're still missing files, try untagged blocks and infer by
+    # content — iter_code_blocks is lazy, so once all three slots fill
+    # the remaining blocks are never extracted.
     if len(files) < 3:
-        all_blocks = _CODE_BLOCK_RE.findall(raw)
-        for block in all_blocks:
+        for block in iter_code_blocks(raw):
             block = block.strip()
             if not block:
                 continue
-            if "index.html" not in files and ("<!DOCTYPE" in block or "<html" in block):
-                files["index.html"] = block
-            elif "style.css" not in files and ("{" in block and ("margin" in block or "padding" in block or "body" in block or "canvas" in block)):
-                files["style.css"] = block
-            elif "game.js" not in files and ("function" in block or "const " in block or "var " in block or "class " in block):
-                files["game.js"] = block
+            filename = _classify_untagged(block)
+            if filename and filename not in files:
+                files[filename] = block
+                if len(files) == 3:
+                    break
 
     # Final fallback: ensure all three keys exist
     for key in ("index.html", "style.css", "game.js"):
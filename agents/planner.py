@@ -6,12 +6,15 @@ document, including framework selection, technical architecture, asset
 specs, controls, and implementation notes.
 """
 
-import json
 import logging
 from typing import Dict
 
+import orjson
+
 from prompts.agent_prompts import PLANNER_PROMPT
-from utils.api_helpers import call_llm
+from utils.api_helpers import acall_llm, call_llm
+from utils.json_extract import extract_first_json
+from utils.parsing import strip_fences
 
 logger = logging.getLogger(__name__)
 
@@ -30,20 +33,36 @@ def run_planner(state) -> Dict:
     dict
         Parsed game design document.
     """
-    # Build a concise summary of requirements for the planner
+    raw_response = call_llm(
+        agent_name="planner",
+        system_prompt=PLANNER_PROMPT,
+        user_message=_build_user_message(state),
+    )
+    return _finish(raw_response)
+
+
+async def arun_planner(state) -> Dict:
+    """Async variant of :func:`run_planner` — awaits the LLM call."""
+    raw_response = await acall_llm(
+        agent_name="planner",
+        system_prompt=PLANNER_PROMPT,
+        user_message=_build_user_message(state),
+    )
+    return _finish(raw_response)
+
+
+def _build_user_message(state) -> str:
+    """Build the planner prompt from the gathered requirements."""
     req_text = _format_requirements(state.requirements)
-    user_message = (
+    return (
         f"Create a complete game design document for the following game:\n\n"
         f"{req_text}\n\n"
         f"Original user idea: {state.user_input}"
     )
 
-    raw_response = call_llm(
-        agent_name="planner",
-        system_prompt=PLANNER_PROMPT,
-        user_message=user_message,
-    )
 
+def _finish(raw_response: str) -> Dict:
+    """Parse the raw LLM response and log the outcome."""
     plan = _parse_planner_response(raw_response)
     logger.info("Game plan generated — title: %s", plan.get("metadata", {}).get("game_title", "?"))
     return plan
@@ -74,27 +93,23 @@ def _parse_planner_response(raw: str) -> Dict:
     text = raw.strip()
 
     # Strip markdown fences if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines)
+    text = strip_fences(text)
 
     try:
-        data = json.loads(text)
+        data = orjson.loads(text)
         if isinstance(data, dict):
             return data
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         pass
 
-    # Fallback: try to find JSON object in the response
-    start = text.find("{")
-    end = text.rfind("}") + 1
-    if start != -1 and end > start:
+    # Fallback: first balanced JSON object in the response
+    candidate = extract_first_json(text)
+    if candidate is not None:
         try:
-            data = json.loads(text[start:end])
+            data = orjson.loads(candidate)
             if isinstance(data, dict):
                 return data
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
     logger.error("Could not parse any JSON from Planner response. Using fallback.")
@@ -8,16 +8,34 @@ Two-layer validation:
 Returns a unified ``{"is_valid": bool, "issues": [...], "suggestions": [...]}``
 """
 
-import json
+import asyncio
 import logging
-from typing import Dict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
 
-from prompts.agent_prompts import VALIDATOR_PROMPT
-from utils.api_helpers import call_llm
+import orjson
+
+from prompts.agent_prompts import VALIDATOR_SEMANTIC_PROMPT
+from utils.api_helpers import acall_llm, call_llm
+from utils.json_extract import extract_first_json
+from utils.parsing import strip_fences
 from utils.validation import run_all_checks
 
 logger = logging.getLogger(__name__)
 
+# Pool for the regex-heavy structural checks.  Created lazily — spawning
+# worker processes at import time would slow every CLI start and test
+# run for a pool only the async path uses.
+_CPU_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_cpu_pool() -> ProcessPoolExecutor:
+    global _CPU_POOL
+    if _CPU_POOL is None:
+        _CPU_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _CPU_POOL
+
 
 def run_validator(state) -> Dict:
     """
@@ -49,19 +67,69 @@ def run_validator(state) -> Dict:
     code_summary = _build_code_summary(files)
     raw_response = call_llm(
         agent_name="validator",
-        system_prompt=VALIDATOR_PROMPT,
+        system_prompt=VALIDATOR_SEMANTIC_PROMPT,
         user_message=code_summary,
     )
+    return _finish(raw_response)
 
-    result = _parse_validator_response(raw_response)
-    logger.info("Validator result — valid=%s, issues=%d", result["is_valid"], len(result["issues"]))
-    return result
+
+async def arun_validator(state) -> Dict:
+    """
+    Async variant of :func:`run_validator`.
+
+    The Layer-2 LLM review is kicked off *concurrently* with the Layer-1
+    structural checks: in the common case where the checks pass, the LLM
+    round-trip has already been in flight, so the caller no longer pays
+    check time plus LLM time back-to-back.  If the structural checks
+    fail, the in-flight LLM call is cancelled.
+
+    Syntax and wiring are fully covered by the Layer-1 local checks, so
+    the LLM is asked only the semantic residual.
+    """
+    files = state.generated_files
+
+    llm_task = asyncio.create_task(
+        acall_llm(
+            agent_name="validator",
+            system_prompt=VALIDATOR_SEMANTIC_PROMPT,
+            user_message=_build_code_summary(files),
+        )
+    )
+
+    # Off the event loop *and* off the GIL: with N builds in flight the
+    # other N-1 pipelines keep progressing while the checks run.
+    loop = asyncio.get_running_loop()
+    struct_ok, struct_issues = await loop.run_in_executor(
+        _get_cpu_pool(), run_all_checks, files, state.game_plan
+    )
+    if not struct_ok:
+        llm_task.cancel()
+        try:
+            await llm_task
+        except asyncio.CancelledError:
+            pass
+        logger.warning("Structural validation failed: %s", struct_issues)
+        return {
+            "is_valid": False,
+            "issues": struct_issues,
+            "suggestions": ["Fix the structural issues above and regenerate."],
+        }
+
+    raw_response = await llm_task
+    return _finish(raw_response)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _finish(raw_response: str) -> Dict:
+    """Parse the raw LLM response and log the outcome."""
+    result = _parse_validator_response(raw_response)
+    logger.info("Validator result — valid=%s, issues=%d", result["is_valid"], len(result["issues"]))
+    return result
+
+
 def _build_code_summary(files: Dict[str, str]) -> str:
     """Assemble the generated files into a single string for the LLM."""
     parts = []
@@ -76,28 +144,23 @@ def _parse_validator_response(raw: str) -> Dict:
     text = raw.strip()
 
     # Strip markdown fences
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines)
+    text = strip_fences(text)
 
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError:
-        # Try to find JSON in response
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start != -1 and end > start:
-            try:
-                data = json.loads(text[start:end])
-            except json.JSONDecodeError:
-                logger.error("Could not parse Validator JSON response.")
-                return {
-                    "is_valid": False,
-                    "issues": ["Validator response was not valid JSON — treating as failure."],
-                    "suggestions": [],
-                }
-        else:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Fall back to the first balanced JSON object in the response
+        candidate = extract_first_json(text)
+        if candidate is None:
+            return {
+                "is_valid": False,
+                "issues": ["Validator response was not valid JSON — treating as failure."],
+                "suggestions": [],
+            }
+        try:
+            data = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            logger.error("Could not parse Validator JSON response.")
             return {
                 "is_valid": False,
                 "issues": ["Validator response was not valid JSON — treating as failure."],
@@ -9,9 +9,17 @@ LLM Provider: Google Gemini (via google-genai SDK)
 """
 
 import os
+from typing import NamedTuple
+
 from dotenv import load_dotenv
 
-load_dotenv()
+# Skip the .env filesystem probe in subprocesses (e.g. validation pool
+# workers) that already inherited a populated environment.
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
+
+_HERE = os.path.abspath(os.path.dirname(__file__))
 
 # ---------------------------------------------------------------------------
 # Model Configuration — per-agent routing
@@ -48,15 +56,53 @@ MODEL_CONFIG = {
     },
 }
 
+class AgentCfg(NamedTuple):
+    """Immutable per-agent model settings, for attribute access on hot paths."""
+
+    model: str
+    temperature: float
+    max_output_tokens: int
+    top_p: float
+    top_k: int
+
+
+# Frozen view of MODEL_CONFIG, materialised once at import.  Callers on
+# the request path read cfg.model / cfg.temperature instead of doing a
+# dict lookup (plus .get with a default) per field — and a typo'd agent
+# name fails here, at import, rather than at the first call.
+# MODEL_CONFIG above remains the single place settings are edited.
+AGENT_CFG: dict[str, AgentCfg] = {
+    name: AgentCfg(
+        model=cfg["model"],
+        temperature=cfg["temperature"],
+        max_output_tokens=cfg["max_output_tokens"],
+        top_p=cfg.get("top_p", 0.9),
+        top_k=cfg.get("top_k", 40),
+    )
+    for name, cfg in MODEL_CONFIG.items()
+}
+
 # ---------------------------------------------------------------------------
 # Environment-driven constants
 # ---------------------------------------------------------------------------
 
 GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
 MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+MAX_CONCURRENT_BUILDS: int = int(os.getenv("MAX_CONCURRENT_BUILDS", "4"))
+PROMPT_CACHE_ENABLED: bool = os.getenv("PROMPT_CACHE", "1") == "1"
+PROMPT_CACHE_TTL_S: int = 300  # server-side cache lifetime (Gemini minimum)
+# Opt-in: replaying cached responses is only sensible at low temperature.
+LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE", "0") == "1"
+LLM_CACHE_DIR: str = os.getenv(
+    "LLM_CACHE_DIR", os.path.expanduser("~/.agentic_gb_cache")
+)
+# Proactive request shaping: cap outbound LLM calls at this many
+# requests per minute (0 = disabled).  Set just under the provider's
+# published quota to avoid ever paying the 429 back-off penalty.
+LLM_MAX_RPM: int = int(os.getenv("LLM_MAX_RPM", "0"))
 API_TIMEOUT: int = 300  # seconds
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
 # Output directories
-OUTPUT_DIR: str = os.path.join(os.path.dirname(__file__), "output")
+OUTPUT_DIR: str = os.path.join(_HERE, "output")
 FAILED_DIR: str = os.path.join(OUTPUT_DIR, "failed")
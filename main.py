@@ -9,19 +9,25 @@ Rich-powered interactive interface that drives the orchestrator pipeline:
   5. Output files
 """
 
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
 import sys
+from contextlib import contextmanager
 
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from rich.theme import Theme
 
 from config import LOG_LEVEL
-from orchestrator import GameBuilderOrchestrator
+
+# Heavy modules (orchestrator → pydantic + all four agents + the GenAI
+# SDK, rich.table) are imported lazily inside the functions that need
+# them, so the banner and the first input() prompt appear immediately.
 
 # ---------------------------------------------------------------------------
 # Logging setup — RichHandler (console) + FileHandler (agent.log)
@@ -36,6 +42,16 @@ custom_theme = Theme({
 
 console = Console(theme=custom_theme)
 
+# Batch file-log writes: the executor phase logs heavily, and a plain
+# FileHandler pays one write syscall per record.  MemoryHandler flushes
+# every 256 records (or immediately on ERROR); atexit drains the rest.
+_file_handler = logging.handlers.MemoryHandler(
+    capacity=256,
+    flushLevel=logging.ERROR,
+    target=logging.FileHandler("agent.log", encoding="utf-8"),
+)
+atexit.register(_file_handler.flush)
+
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
     format="%(message)s",
@@ -46,7 +62,7 @@ logging.basicConfig(
             rich_tracebacks=True,
             show_path=False,
         ),
-        logging.FileHandler("agent.log", encoding="utf-8"),
+        _file_handler,
     ],
 )
 
@@ -57,6 +73,37 @@ logger = logging.getLogger("game_builder")
 # Display helpers
 # ---------------------------------------------------------------------------
 
+# One Progress instance serves every phase spinner.  It is created
+# lazily and started/stopped around each phase so prompts and tables in
+# between render normally.
+_progress: Progress | None = None
+
+
+@contextmanager
+def phase_spinner(label: str):
+    """Show a transient spinner with *label* for the duration of a phase.
+
+    Yields ``(progress, task)`` so callers can update the description
+    (e.g. live streaming stats).
+    """
+    global _progress
+    if _progress is None:
+        _progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+            refresh_per_second=2,
+        )
+    task = _progress.add_task(label, total=None)
+    _progress.start()
+    try:
+        yield _progress, task
+    finally:
+        _progress.remove_task(task)
+        _progress.stop()
+
+
 def show_banner():
     """Print a fancy startup banner."""
     banner = (
@@ -69,6 +116,8 @@ def show_banner():
 
 def show_plan_table(plan: dict):
     """Display the game design document in a Rich Table."""
+    from rich.table import Table
+
     metadata = plan.get("metadata", {})
     rules = plan.get("game_rules", {})
     tech = plan.get("technical_architecture", {})
@@ -108,8 +157,14 @@ def show_plan_table(plan: dict):
     console.print()
 
 
-def show_files_summary(files: dict[str, str], output_dir: str):
+def show_files_summary(
+    files: dict[str, str],
+    output_dir: str,
+    sizes: dict[str, int] | None = None,
+):
     """Show a summary of generated files."""
+    from rich.table import Table
+
     table = Table(
         title="📁 Generated Files",
         border_style="green",
@@ -119,9 +174,14 @@ def show_files_summary(files: dict[str, str], output_dir: str):
     table.add_column("File", style="bold")
     table.add_column("Size", justify="right")
 
+    sizes = sizes or {}
     for fname, content in files.items():
-        size_kb = len(content.encode("utf-8")) / 1024
-        table.add_row(fname, f"{size_kb:.1f} KB")
+        # Prefer the byte size computed at generation time; re-encoding
+        # here would allocate a throwaway copy of each file.
+        size = sizes.get(fname)
+        if size is None:
+            size = len(content.encode("utf-8"))
+        table.add_row(fname, f"{size / 1024:.1f} KB")
 
     console.print(table)
     console.print(
@@ -134,7 +194,7 @@ def show_files_summary(files: dict[str, str], output_dir: str):
 # Interactive clarification loop
 # ---------------------------------------------------------------------------
 
-def run_clarification_loop(orchestrator: GameBuilderOrchestrator):
+async def run_clarification_loop(orchestrator: "GameBuilderOrchestrator"):
     """
     Present clarification questions to the user and feed answers back
     into the orchestrator until requirements are complete.
@@ -146,14 +206,8 @@ def run_clarification_loop(orchestrator: GameBuilderOrchestrator):
         round_num += 1
 
         # Run clarifier
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            progress.add_task("Analysing your game idea …", total=None)
-            orchestrator._run_clarifier()
+        with phase_spinner("Analysing your game idea …"):
+            await orchestrator._run_clarifier()
 
         # Check if requirements are already complete
         if orchestrator.state.current_phase != "clarifying":
@@ -163,14 +217,19 @@ def run_clarification_loop(orchestrator: GameBuilderOrchestrator):
         if not questions:
             break
 
-        # Present questions
+        # Present all questions up front, then collect the answers — the
+        # user can think about later questions while typing earlier
+        # answers instead of waiting for each prompt to appear.
         console.print(
             "\n[bold yellow]❓ A few quick questions to refine your game:[/bold yellow]\n"
         )
-        responses = []
         for i, question in enumerate(questions, 1):
             console.print(f"[cyan]{i}.[/cyan] {question}")
-            answer = input("   → ").strip()
+        console.print()
+
+        responses = []
+        for i in range(1, len(questions) + 1):
+            answer = (await asyncio.to_thread(input, f"   {i} → ")).strip()
             if not answer:
                 answer = "No preference, use your best judgement."
             responses.append(answer)
@@ -185,12 +244,27 @@ def run_clarification_loop(orchestrator: GameBuilderOrchestrator):
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
+def _prewarm_client():
+    """Build the shared GenAI client (TLS/auth setup) ahead of first use."""
+    try:
+        from utils.api_helpers import get_client
+
+        get_client()
+    except Exception:
+        # Missing key / offline — the first real call will surface this.
+        pass
+
+
+async def main():
     show_banner()
 
+    # Overlap client construction with the user's typing time, so the
+    # first clarifier call starts on a warm connection.
+    prewarm = asyncio.create_task(asyncio.to_thread(_prewarm_client))
+
     # Get game idea
     console.print("[bold]Enter your game idea:[/bold]")
-    user_input = input("→ ").strip()
+    user_input = (await asyncio.to_thread(input, "→ ")).strip()
 
     if not user_input:
         console.print("[error]No input provided. Exiting.[/error]")
@@ -199,13 +273,16 @@ def main():
     logger.info("User input: %s", user_input)
     console.print()
 
-    # Create orchestrator
+    # Create orchestrator (first import of pydantic + the agent stack)
+    from orchestrator import GameBuilderOrchestrator
+
     orchestrator = GameBuilderOrchestrator()
     orchestrator.state = __import__("orchestrator").GameBuilderState(user_input=user_input)
 
     # Phase 1: Clarification
+    await prewarm
     console.print(Panel("[bold cyan]Phase 1: Requirements Clarification[/bold cyan]", border_style="cyan"))
-    run_clarification_loop(orchestrator)
+    await run_clarification_loop(orchestrator)
 
     if orchestrator.state.requirements:
         console.print("[success]✅ Requirements gathered successfully![/success]\n")
@@ -214,14 +291,8 @@ def main():
 
     # Phase 2: Planning
     console.print(Panel("[bold cyan]Phase 2: Game Planning[/bold cyan]", border_style="cyan"))
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        progress.add_task("Designing your game architecture …", total=None)
-        orchestrator._run_planner()
+    with phase_spinner("Designing your game architecture …"):
+        await orchestrator._run_planner()
 
     if orchestrator.state.game_plan:
         show_plan_table(orchestrator.state.game_plan)
@@ -229,54 +300,68 @@ def main():
     # Phase 3 & 4: Execution + Validation (with retry loop)
     console.print(Panel("[bold cyan]Phase 3: Code Generation & Validation[/bold cyan]", border_style="cyan"))
 
+    async def _executing_phase():
+        attempt = orchestrator.state.retry_count + 1
+        label = f"Generating game code (attempt {attempt}) …"
+        with phase_spinner(label) as (progress, task):
+            streamed = 0
+
+            def _on_chunk(delta: str):
+                # Live generation feedback: KB streamed so far plus
+                # files already completed mid-stream.
+                nonlocal streamed
+                streamed += len(delta)
+                done = len(orchestrator.state.generated_files)
+                progress.update(
+                    task,
+                    description=(
+                        f"{label} [dim]{streamed / 1024:.1f} KB"
+                        f" · {done}/3 files[/dim]"
+                    ),
+                )
+
+            await orchestrator._run_executor(on_chunk=_on_chunk)
+
+    async def _validating_phase():
+        with phase_spinner("Validating generated code …"):
+            await orchestrator._run_validator()
+
+        if not orchestrator.state.is_complete:
+            vr = orchestrator.state.validation_result or {}
+            issues = vr.get("issues", [])
+            if issues:
+                console.print("[warning]⚠️  Validation issues found:[/warning]")
+                for issue in issues:
+                    console.print(f"   [yellow]• {issue}[/yellow]")
+                console.print()
+
+    # Mirror of the orchestrator's dispatch table, with the phase UI
+    # attached; an unknown phase simply exits the loop.
+    phase_ui = {
+        "executing": _executing_phase,
+        "validating": _validating_phase,
+    }
+
     while not orchestrator.state.is_complete:
-        phase = orchestrator.state.current_phase
-
-        if phase == "executing":
-            attempt = orchestrator.state.retry_count + 1
-            label = f"Generating game code (attempt {attempt}) …"
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True,
-            ) as progress:
-                progress.add_task(label, total=None)
-                orchestrator._run_executor()
-
-        elif phase == "validating":
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True,
-            ) as progress:
-                progress.add_task("Validating generated code …", total=None)
-                orchestrator._run_validator()
-
-            if not orchestrator.state.is_complete:
-                vr = orchestrator.state.validation_result or {}
-                issues = vr.get("issues", [])
-                if issues:
-                    console.print("[warning]⚠️  Validation issues found:[/warning]")
-                    for issue in issues:
-                        console.print(f"   [yellow]• {issue}[/yellow]")
-                    console.print()
-        else:
+        handler = phase_ui.get(orchestrator.state.current_phase)
+        if handler is None:
             break
+        await handler()
 
     # Final output
     console.print()
     if orchestrator.state.generated_files:
-        from utils.file_manager import save_game_files
-        title = "generated-game"
-        if orchestrator.state.game_plan:
-            title = orchestrator.state.game_plan.get("metadata", {}).get("game_title", title)
-        output_dir = os.path.join(
-            os.path.dirname(__file__), "output",
-            title.lower().strip().replace(" ", "-"),
+        # The orchestrator records where save_game_files actually wrote;
+        # re-deriving the slug here used a different transform and could
+        # point at a directory that doesn't exist.
+        output_dir = orchestrator.state.output_path or os.path.join(
+            os.path.dirname(__file__), "output"
+        )
+        show_files_summary(
+            orchestrator.state.generated_files,
+            output_dir,
+            sizes=orchestrator.state.generated_file_sizes,
         )
-        show_files_summary(orchestrator.state.generated_files, output_dir)
     else:
         console.print("[error]❌ No game files were generated.[/error]")
 
@@ -291,4 +376,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
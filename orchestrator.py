@@ -5,17 +5,17 @@ Custom sequential orchestrator using a while-loop with Pydantic V2 state.
 Pipeline: clarifier() → planner() → executor() → validator() → retry_check()
 """
 
+import asyncio
 import logging
 from typing import Optional, List, Dict
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field
 
-from config import MAX_RETRIES
-from agents.clarifier import run_clarifier
-from agents.planner import run_planner
-from agents.executor import run_executor
-from agents.validator import run_validator
-from utils.file_manager import save_game_files, save_failed_attempt
+from config import MAX_CONCURRENT_BUILDS, MAX_RETRIES
+
+# Agent modules (and the GenAI SDK they pull in) are imported lazily in
+# the phase runners, so importing the orchestrator — e.g. just for the
+# GameBuilderState schema — stays cheap.
 
 logger = logging.getLogger(__name__)
 
@@ -28,18 +28,33 @@ class GameBuilderState(BaseModel):
     """Immutable-ish state object passed through the entire pipeline."""
 
     user_input: str
-    conversation_history: List[Dict[str, str]] = Field(default_factory=list)
+    # Conversation history as parallel lists (structure-of-arrays):
+    # one role flag (0=assistant, 1=user) plus one content string per
+    # message.  Far lighter than a dict per message, and prompt
+    # assembly iterates two flat lists instead of doing dict lookups.
+    history_roles: List[int] = Field(default_factory=list)
+    history_contents: List[str] = Field(default_factory=list)
     clarification_questions: List[str] = Field(default_factory=list)
     user_responses: List[str] = Field(default_factory=list)
     requirements: Optional[Dict] = None
     game_plan: Optional[Dict] = None
     generated_files: Dict[str, str] = Field(default_factory=dict)
+    generated_file_sizes: Dict[str, int] = Field(default_factory=dict)
     current_phase: str = "clarifying"
     is_complete: bool = False
     validation_result: Optional[Dict] = None
+    output_path: Optional[str] = None
     retry_count: int = Field(default=0, ge=0, le=3)
 
-    model_config = ConfigDict(validate_assignment=True)
+    # validate_assignment is deliberately off: the orchestrator mutates
+    # state on every phase transition, and per-assignment validator
+    # dispatch is pure overhead for these trusted internal writes.
+    # Construction still validates; callers re-check at phase
+    # boundaries via validate_state().
+
+    def validate_state(self) -> None:
+        """Explicitly re-validate all fields (e.g. retry_count bounds)."""
+        self.__class__.model_validate(self.model_dump())
 
 
 # ---------------------------------------------------------------------------
@@ -57,10 +72,18 @@ class GameBuilderOrchestrator:
 
     def __init__(self):
         self.state: Optional[GameBuilderState] = None
+        # Phase dispatch table — one dict lookup per transition instead
+        # of re-walking an if/elif chain of string comparisons.
+        self._handlers = {
+            "clarifying": self._run_clarifier,
+            "planning": self._run_planner,
+            "executing": self._run_executor,
+            "validating": self._run_validator,
+        }
 
     # -- public entry point -------------------------------------------------
 
-    def run(self, user_input: str) -> GameBuilderState:
+    async def run(self, user_input: str) -> GameBuilderState:
         """Execute the full pipeline and return final state."""
         self.state = GameBuilderState(user_input=user_input)
         logger.info("Orchestrator initialised — starting pipeline.")
@@ -69,26 +92,35 @@ class GameBuilderOrchestrator:
             phase = self.state.current_phase
             logger.info("Current phase: %s", phase)
 
-            if phase == "clarifying":
-                self._run_clarifier()
-            elif phase == "planning":
-                self._run_planner()
-            elif phase == "executing":
-                self._run_executor()
-            elif phase == "validating":
-                self._run_validator()
-            else:
+            handler = self._handlers.get(phase)
+            if handler is None:
                 logger.error("Unknown phase '%s' — aborting.", phase)
                 break
+            await handler()
+
+            self.state.validate_state()
 
         return self.state
 
     # -- phase runners ------------------------------------------------------
 
-    def _run_clarifier(self):
+    async def _run_clarifier(self):
         """Run the Clarifier agent — returns questions for main.py to present."""
+        from agents.clarifier import arun_clarifier
+        from utils.input_classifier import try_fast_classify
+
+        # Fast path: a well-specified first input (game type + action +
+        # win condition all named) needs no clarification round-trip.
+        if not self.state.history_contents and self.state.requirements is None:
+            requirements = try_fast_classify(self.state.user_input)
+            if requirements is not None:
+                self.state.requirements = requirements
+                self.state.clarification_questions = []
+                self.state.current_phase = "planning"
+                return
+
         logger.info("Running Clarifier agent …")
-        result = run_clarifier(self.state)
+        result = await arun_clarifier(self.state)
         self.state.requirements = result.get("requirements")
         self.state.clarification_questions = result.get("questions", [])
 
@@ -107,35 +139,47 @@ class GameBuilderOrchestrator:
         """Called by main.py after the user answers clarification questions."""
         self.state.user_responses.extend(responses)
         for q, a in zip(self.state.clarification_questions, responses):
-            self.state.conversation_history.append(
-                {"role": "assistant", "content": q}
-            )
-            self.state.conversation_history.append(
-                {"role": "user", "content": a}
-            )
+            self.state.history_roles.extend((0, 1))
+            self.state.history_contents.extend((q, a))
         # Re-run clarifier with the new info
         self.state.clarification_questions = []
 
-    def _run_planner(self):
+    async def _run_planner(self):
         """Run the Planner agent — produces a structured game design."""
+        from agents.planner import arun_planner
+
         logger.info("Running Planner agent …")
-        plan = run_planner(self.state)
+        plan = await arun_planner(self.state)
         self.state.game_plan = plan
         self.state.current_phase = "executing"
         logger.info("Game plan generated — moving to execution.")
 
-    def _run_executor(self):
-        """Run the Executor agent — generates game code files."""
+    async def _run_executor(self, on_chunk=None):
+        """
+        Run the Executor agent — generates game code files.
+
+        *on_chunk* (optional) receives each streamed text delta, letting
+        the CLI render live generation progress.
+        """
+        from agents.executor import arun_executor
+
         logger.info("Running Executor agent …")
-        files = run_executor(self.state)
+        files = await arun_executor(self.state, on_chunk=on_chunk)
         self.state.generated_files = files
+        # Byte sizes are computed once here so display code never has to
+        # re-encode the (potentially large) file contents.
+        self.state.generated_file_sizes = {
+            fname: len(content.encode("utf-8")) for fname, content in files.items()
+        }
         self.state.current_phase = "validating"
         logger.info("Code generated — moving to validation.")
 
-    def _run_validator(self):
+    async def _run_validator(self):
         """Run the Validator agent and decide: done or retry."""
+        from agents.validator import arun_validator
+
         logger.info("Running Validator agent (attempt %d) …", self.state.retry_count + 1)
-        result = run_validator(self.state)
+        result = await arun_validator(self.state)
         self.state.validation_result = result
 
         if result.get("is_valid", False):
@@ -174,16 +218,115 @@ class GameBuilderOrchestrator:
 
     def _save_output(self):
         """Persist the generated game files to the output directory."""
+        from utils.file_manager import save_game_files
+
         title = "generated-game"
         if self.state.game_plan and isinstance(self.state.game_plan, dict):
             metadata = self.state.game_plan.get("metadata", {})
             title = metadata.get("game_title", title)
-        save_game_files(self.state.generated_files, title)
+        # Record where the files actually landed — the CLI reports this
+        # path instead of re-deriving (and possibly mis-deriving) it.
+        self.state.output_path = save_game_files(self.state.generated_files, title)
 
     def _save_failed(self):
         """Persist failed attempts for debugging."""
+        from utils.file_manager import save_failed_attempt
+
         if self.state.generated_files:
             save_failed_attempt(
                 self.state.generated_files,
                 self.state.retry_count,
             )
+
+
+# ---------------------------------------------------------------------------
+# Headless async pipeline (batch builds)
+# ---------------------------------------------------------------------------
+
+async def abuild_game(user_input: str) -> GameBuilderState:
+    """
+    Run the full pipeline for one game idea without user interaction.
+
+    Open clarification questions are auto-answered with the same default
+    that main.py uses for an empty answer, so the pipeline never blocks
+    on stdin.  All LLM calls go through the async client, which lets
+    several builds share one event loop.
+    """
+    from agents.clarifier import arun_clarifier
+    from agents.executor import arun_executor
+    from agents.planner import arun_planner
+    from agents.validator import arun_validator
+
+    orchestrator = GameBuilderOrchestrator()
+    orchestrator.state = GameBuilderState(user_input=user_input)
+    state = orchestrator.state
+
+    # Clarification: at most two headless rounds, then proceed regardless.
+    planner_task = None
+    speculative_reqs = None
+    for round_no in range(2):
+        if round_no and state.requirements:
+            # Speculative planning: plan against the current partial
+            # requirements while the follow-up clarifier turn is in
+            # flight.  If the clarifier leaves them unchanged, the
+            # planner latency is fully hidden; otherwise one in-flight
+            # request is discarded.
+            speculative_reqs = state.requirements
+            planner_task = asyncio.create_task(arun_planner(state.model_copy()))
+
+        result = await arun_clarifier(state)
+        state.requirements = result.get("requirements")
+        questions = result.get("questions", [])
+        if result.get("is_complete", False) or not questions:
+            break
+        for question in questions:
+            state.history_roles.extend((0, 1))
+            state.history_contents.extend(
+                (question, "No preference, use your best judgement.")
+            )
+    state.current_phase = "planning"
+
+    if planner_task is not None and state.requirements == speculative_reqs:
+        logger.info("Speculative plan matched final requirements — reusing it.")
+        state.game_plan = await planner_task
+    else:
+        if planner_task is not None:
+            planner_task.cancel()
+        state.game_plan = await arun_planner(state)
+    state.current_phase = "executing"
+
+    while not state.is_complete:
+        state.generated_files = await arun_executor(state)
+        state.generated_file_sizes = {
+            fname: len(content.encode("utf-8"))
+            for fname, content in state.generated_files.items()
+        }
+        state.current_phase = "validating"
+
+        result = await arun_validator(state)
+        state.validation_result = result
+
+        if result.get("is_valid", False):
+            orchestrator._save_output()
+            state.is_complete = True
+        else:
+            orchestrator._handle_retry(result)
+
+    return state
+
+
+async def batch_build_games(
+    ideas: List[str],
+    max_concurrency: int = MAX_CONCURRENT_BUILDS,
+) -> List[GameBuilderState]:
+    """
+    Build many games concurrently, bounded by a semaphore so we stay
+    under the provider's requests-per-minute limits.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _build(idea: str) -> GameBuilderState:
+        async with semaphore:
+            return await abuild_game(idea)
+
+    return await asyncio.gather(*(_build(idea) for idea in ideas))
@@ -185,21 +185,23 @@ Generate all three files now.  They must constitute a fully working game.
 # VALIDATOR
 # ────────────────────────────────────────────────────────────────────────────
 
-VALIDATOR_PROMPT = """\
-You are a QA Engineer for browser-based game code. Validate the generated \
-game files against this checklist.
+# Residual LLM share of the validator checklist.  File presence, stub
+# detection, game-loop/event wiring, and brace balance are all verified
+# deterministically in utils/validation.py — the LLM is only asked what
+# a regex cannot answer: whether the implemented logic is actually
+# correct and reachable.
+
+VALIDATOR_SEMANTIC_PROMPT = """\
+You are a QA Engineer for browser-based game code. Review the generated \
+game files for SEMANTIC correctness only — structure and syntax have \
+already been machine-checked.
 
 **Validation Checklist:**
-1. All three files present and non-empty (index.html, style.css, game.js)
-2. No TODO comments, PLACEHOLDER text, or stub functions
-3. All functions have real implementation (not empty bodies)
-4. Game loop exists (requestAnimationFrame or Phaser update)
-5. Collision detection is implemented
-6. Win/lose conditions are implemented
-7. Restart / Play Again functionality exists
-8. No obvious syntax errors (mismatched braces, missing semicolons)
-9. Canvas or Phaser container is properly initialised
-10. Keyboard/mouse controls are bound
+1. All functions contain real logic that affects gameplay
+2. Collision detection is implemented correctly
+3. Win/lose conditions are implemented and reachable in play
+4. Restart / Play Again functionality actually resets the game state
+5. Keyboard/mouse controls actually drive the player
 
 **Output format — respond with ONLY valid JSON:**
 {
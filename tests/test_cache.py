@@ -0,0 +1,51 @@
+"""
+Test: Persistent LLM response cache.
+"""
+
+from utils import cache
+
+
+class TestResponseKey:
+    def test_stable(self):
+        k1 = cache.response_key("executor", "m", "sys", "user")
+        k2 = cache.response_key("executor", "m", "sys", "user")
+        assert k1 == k2
+
+    def test_differs_per_field(self):
+        base = cache.response_key("executor", "m", "sys", "user")
+        assert cache.response_key("planner", "m", "sys", "user") != base
+        assert cache.response_key("executor", "m2", "sys", "user") != base
+        assert cache.response_key("executor", "m", "sys2", "user") != base
+        assert cache.response_key("executor", "m", "sys", "user2") != base
+
+    def test_no_boundary_collision(self):
+        # "ab" + "c" must not collide with "a" + "bc"
+        assert cache.response_key("ab", "c", "s", "u") != cache.response_key(
+            "a", "bc", "s", "u"
+        )
+
+
+class TestEnabled:
+    def test_zero_temperature_always_cacheable(self, monkeypatch):
+        monkeypatch.setattr(cache, "LLM_CACHE_ENABLED", False)
+        assert cache.enabled(0.0) is True
+
+    def test_nonzero_temperature_respects_opt_in(self, monkeypatch):
+        monkeypatch.setattr(cache, "LLM_CACHE_ENABLED", False)
+        assert cache.enabled(0.2) is False
+        monkeypatch.setattr(cache, "LLM_CACHE_ENABLED", True)
+        assert cache.enabled(0.2) is True
+
+
+class TestStore:
+    def test_roundtrip(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache, "LLM_CACHE_DIR", str(tmp_path / "cache"))
+        key = cache.response_key("executor", "m", "sys", "user")
+        assert cache.lookup(key) is None
+        cache.store(key, "generated code")
+        assert cache.lookup(key) == "generated code"
+
+    def test_empty_response_not_stored(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache, "LLM_CACHE_DIR", str(tmp_path / "cache"))
+        cache.store("somekey", "")
+        assert cache.lookup("somekey") is None
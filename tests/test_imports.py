@@ -17,7 +17,11 @@ MODULES = [
     "prompts.agent_prompts",
     "utils",
     "utils.api_helpers",
+    "utils.cache",
     "utils.file_manager",
+    "utils.input_classifier",
+    "utils.json_extract",
+    "utils.parsing",
     "utils.validation",
 ]
 
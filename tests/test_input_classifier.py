@@ -0,0 +1,39 @@
+"""
+Test: Local fast-path classification of well-specified game ideas.
+"""
+
+from utils.input_classifier import try_fast_classify
+
+
+class TestTryFastClassify:
+    def test_fully_specified_input(self):
+        reqs = try_fast_classify(
+            "A platformer where you jump between ledges and win by "
+            "reaching the flag, arrow keys to move"
+        )
+        assert reqs is not None
+        assert reqs["game_type"] == "platformer"
+        assert reqs["core_mechanic"] == "jump"
+        assert reqs["win_condition"] == "win"
+        assert reqs["control_scheme"] == "arrow keys"
+
+    def test_missing_win_condition(self):
+        assert try_fast_classify("A shooter where you shoot aliens") is None
+
+    def test_missing_game_type(self):
+        assert try_fast_classify("You jump around and try to win") is None
+
+    def test_vague_input(self):
+        assert try_fast_classify("Make me something fun") is None
+
+    def test_unspecified_fields_deferred(self):
+        reqs = try_fast_classify("snake game, eat apples to score points")
+        assert reqs is not None
+        assert reqs["control_scheme"] == "Agent will decide"
+        assert reqs["visual_style"] == "Agent will decide"
+
+    def test_case_insensitive(self):
+        reqs = try_fast_classify("PONG: dodge nothing, just SCORE with WASD")
+        assert reqs is not None
+        assert reqs["game_type"] == "pong"
+        assert reqs["control_scheme"] == "wasd"
@@ -0,0 +1,38 @@
+"""
+Test: Brace-balanced JSON extraction.
+"""
+
+import json
+from utils.json_extract import extract_first_json
+
+
+class TestExtractFirstJson:
+    def test_plain_object(self):
+        assert extract_first_json('{"a": 1}') == '{"a": 1}'
+
+    def test_surrounding_prose(self):
+        text = 'Here is the plan:\n{"a": 1}\nHope that helps!'
+        assert extract_first_json(text) == '{"a": 1}'
+
+    def test_trailing_prose_with_brace(self):
+        # A blind rfind("}") would grab the prose brace and break parsing.
+        text = '{"a": 1} and remember: use {curly} syntax'
+        assert json.loads(extract_first_json(text)) == {"a": 1}
+
+    def test_nested_objects(self):
+        text = 'x {"a": {"b": {"c": 3}}} y'
+        assert json.loads(extract_first_json(text)) == {"a": {"b": {"c": 3}}}
+
+    def test_braces_inside_strings(self):
+        text = '{"code": "function f() { return {}; }"}'
+        assert extract_first_json(text) == text
+
+    def test_escaped_quotes(self):
+        text = '{"msg": "she said \\"hi\\" {ok}"}'
+        assert extract_first_json(text) == text
+
+    def test_no_object(self):
+        assert extract_first_json("no json here") is None
+
+    def test_unbalanced(self):
+        assert extract_first_json('{"a": 1') is None
@@ -17,9 +17,11 @@ class TestGameBuilderState:
         assert state.is_complete is False
         assert state.retry_count == 0
         assert state.generated_files == {}
-        assert state.conversation_history == []
+        assert state.history_roles == []
+        assert state.history_contents == []
 
-    def test_validate_assignment(self):
+    def test_plain_assignment(self):
+        # Assignment is a plain attribute write — no validator dispatch.
         state = GameBuilderState(user_input="test")
         state.current_phase = "planning"
         assert state.current_phase == "planning"
@@ -27,11 +29,13 @@ class TestGameBuilderState:
     def test_retry_count_bounds(self):
         state = GameBuilderState(user_input="test")
         state.retry_count = 3
+        state.validate_state()
         assert state.retry_count == 3
 
         with pytest.raises(Exception):
-            # Pydantic should reject retry_count > 3
+            # Explicit validation should reject retry_count > 3
             state.retry_count = 4
+            state.validate_state()
 
     def test_retry_count_negative(self):
         with pytest.raises(Exception):
@@ -0,0 +1,28 @@
+"""
+Test: Shared markdown-fence stripping.
+"""
+
+from utils.parsing import strip_fences
+
+
+class TestStripFences:
+    def test_no_fences(self):
+        assert strip_fences('{"a": 1}') == '{"a": 1}'
+
+    def test_json_fence(self):
+        assert strip_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_bare_fence(self):
+        assert strip_fences('```\n{"a": 1}\n```') == '{"a": 1}'
+
+    def test_multiline_body(self):
+        text = '```json\n{\n  "a": 1\n}\n```'
+        assert strip_fences(text) == '{\n  "a": 1\n}'
+
+    def test_missing_closing_fence(self):
+        # Irregular output goes through the fallback regex
+        assert strip_fences('```json\n{"a": 1}') == '{"a": 1}'
+
+    def test_leading_text_untouched(self):
+        text = 'Here you go:\n```json\n{"a": 1}\n```'
+        assert strip_fences(text) == text
@@ -5,6 +5,8 @@ Test: Code validation utilities.
 import pytest
 from utils.validation import (
     extract_code_blocks,
+    iter_code_blocks,
+    check_brace_balance,
     check_completeness,
     validate_html_structure,
     validate_js_structure,
@@ -44,6 +46,18 @@ class TestExtractCodeBlocks:
         assert len(blocks) == 1
 
 
+class TestIterCodeBlocks:
+    def test_matches_extract(self):
+        text = "```html\n<h1>Hi</h1>\n```\n```js\nalert(1);\n```"
+        assert list(iter_code_blocks(text)) == extract_code_blocks(text)
+
+    def test_is_lazy(self):
+        text = "```js\nfirst();\n```\n```js\nsecond();\n```"
+        it = iter_code_blocks(text)
+        assert "first" in next(it)
+        assert "second" in next(it)
+
+
 # ---------------------------------------------------------------------------
 # check_completeness
 # ---------------------------------------------------------------------------
@@ -68,6 +82,32 @@ class TestCheckCompleteness:
         assert ok is False
 
 
+# ---------------------------------------------------------------------------
+# check_brace_balance
+# ---------------------------------------------------------------------------
+
+class TestCheckBraceBalance:
+    def test_balanced(self):
+        ok, issues = check_brace_balance("function f(a) { return [a]; }")
+        assert ok is True
+        assert issues == []
+
+    def test_unclosed_brace(self):
+        ok, issues = check_brace_balance("function f() { if (x) {")
+        assert ok is False
+        assert any("braces" in i for i in issues)
+
+    def test_extra_closing_paren(self):
+        ok, issues = check_brace_balance("f(x));")
+        assert ok is False
+        assert any("parentheses" in i for i in issues)
+
+    def test_truncated_output(self):
+        # Typical truncation: file ends mid-function
+        ok, issues = check_brace_balance("function loop() {\n  update(\n")
+        assert ok is False
+
+
 # ---------------------------------------------------------------------------
 # validate_html_structure
 # ---------------------------------------------------------------------------
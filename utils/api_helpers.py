@@ -7,14 +7,26 @@ Production-grade wrapper around the Google GenAI SDK (Gemini).
 * Provider-agnostic retry logic
 """
 
+import asyncio
 import functools
+import inspect
 import logging
+import threading
 import time
 
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 
-from config import GOOGLE_API_KEY, MODEL_CONFIG
+from config import (
+    AGENT_CFG,
+    API_TIMEOUT,
+    GOOGLE_API_KEY,
+    LLM_MAX_RPM,
+    PROMPT_CACHE_ENABLED,
+    PROMPT_CACHE_TTL_S,
+)
+from utils import cache as response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,95 +34,381 @@ logger = logging.getLogger(__name__)
 # Google GenAI client singleton
 # ---------------------------------------------------------------------------
 
-_client: genai.Client | None = None
+@functools.cache
+def get_client() -> genai.Client:
+    """
+    Return the shared Google GenAI client.
 
+    functools.cache turns repeat calls into a C-level dict hit and is
+    thread-safe under the GIL; a missing API key raises on every call
+    (exceptions are not cached), so fixing the environment mid-session
+    still works.
+    """
+    if not GOOGLE_API_KEY:
+        raise RuntimeError(
+            "GOOGLE_API_KEY is not set. "
+            "Create a .env file or export the variable."
+        )
+    client = genai.Client(
+        api_key=GOOGLE_API_KEY,
+        # HttpOptions takes the timeout in milliseconds.
+        http_options=types.HttpOptions(timeout=API_TIMEOUT * 1000),
+    )
+    logger.info("Google GenAI client initialised.")
+    return client
 
-def get_client() -> genai.Client:
-    """Return a reusable Google GenAI client."""
-    global _client
-    if _client is None:
-        if not GOOGLE_API_KEY:
-            raise RuntimeError(
-                "GOOGLE_API_KEY is not set. "
-                "Create a .env file or export the variable."
+
+def get_async_client():
+    """
+    Return the async interface of the shared GenAI client.
+
+    Both sync and async paths share one underlying client, so every
+    agent reuses the same connection pool and TLS session instead of
+    paying a fresh handshake per call.
+    """
+    return get_client().aio
+
+
+# ---------------------------------------------------------------------------
+# Token-bucket rate limiter (proactive request shaping)
+# ---------------------------------------------------------------------------
+#
+# Reacting to 429s costs up to 2+4+8 s of back-off per incident; pacing
+# outbound requests to stay just under the provider's RPM quota avoids
+# that penalty entirely.  The rate adapts: a rate-limit error halves it,
+# and sustained successes ramp it slowly back toward the configured cap.
+# Disabled (all functions are no-ops) unless LLM_MAX_RPM is set.
+
+_bucket_lock = threading.Lock()
+_bucket_rate_per_s: float = LLM_MAX_RPM / 60.0
+_bucket_tokens: float = 1.0
+_bucket_last: float = time.monotonic()
+_bucket_successes: int = 0
+
+
+def _acquire_token() -> None:
+    """Block until the bucket grants one request token."""
+    global _bucket_tokens, _bucket_last
+    if LLM_MAX_RPM <= 0:
+        return
+    while True:
+        with _bucket_lock:
+            now = time.monotonic()
+            _bucket_tokens = min(
+                1.0, _bucket_tokens + (now - _bucket_last) * _bucket_rate_per_s
             )
-        _client = genai.Client(api_key=GOOGLE_API_KEY)
-        logger.info("Google GenAI client initialised.")
-    return _client
+            _bucket_last = now
+            if _bucket_tokens >= 1.0:
+                _bucket_tokens -= 1.0
+                return
+            wait = (1.0 - _bucket_tokens) / _bucket_rate_per_s
+        time.sleep(wait)
+
+
+def _throttle_down() -> None:
+    """Halve the request rate after a rate-limit error (floor: 1 RPM)."""
+    global _bucket_rate_per_s, _bucket_successes
+    if LLM_MAX_RPM <= 0:
+        return
+    with _bucket_lock:
+        _bucket_rate_per_s = max(_bucket_rate_per_s / 2.0, 1.0 / 60.0)
+        _bucket_successes = 0
+    logger.info("Request rate throttled to %.1f RPM.", _bucket_rate_per_s * 60)
+
+
+def _throttle_up() -> None:
+    """Ramp the rate back toward the cap after 5 consecutive successes."""
+    global _bucket_rate_per_s, _bucket_successes
+    if LLM_MAX_RPM <= 0:
+        return
+    cap = LLM_MAX_RPM / 60.0
+    with _bucket_lock:
+        if _bucket_rate_per_s >= cap:
+            return
+        _bucket_successes += 1
+        if _bucket_successes >= 5:
+            _bucket_successes = 0
+            _bucket_rate_per_s = min(cap, _bucket_rate_per_s * 1.25)
+
+
+# ---------------------------------------------------------------------------
+# Error classification
+# ---------------------------------------------------------------------------
+
+# HTTP statuses worth an exponential back-off vs a single slower retry.
+_BACKOFF_CODES = frozenset({429, 500, 503})
+_TIMEOUT_CODES = frozenset({504})
+
+# Fallback keywords for exceptions that are not typed APIErrors
+# (transport-level failures, socket timeouts, …).
+_BACKOFF_KEYWORDS = (
+    "429", "resource", "rate", "quota", "exhausted",
+    "503", "500", "unavailable", "server error", "overloaded",
+)
+_TIMEOUT_KEYWORDS = ("timeout", "deadline", "timed out")
+
+
+def _classify_error(exc: Exception) -> str:
+    """
+    Classify an exception as ``"backoff"``, ``"timeout"`` or ``"fatal"``.
+
+    Typed SDK errors carry the HTTP status directly, so the common path
+    is two frozenset membership tests — no ``str(exc).lower()``
+    allocation and no keyword scan.  The substring fallback only runs
+    for untyped exceptions.
+    """
+    if isinstance(exc, genai_errors.APIError):
+        if exc.code in _BACKOFF_CODES:
+            return "backoff"
+        if exc.code in _TIMEOUT_CODES:
+            return "timeout"
+        return "fatal"
+
+    exc_str = str(exc).lower()
+    if any(kw in exc_str for kw in _BACKOFF_KEYWORDS):
+        return "backoff"
+    if any(kw in exc_str for kw in _TIMEOUT_KEYWORDS):
+        return "timeout"
+    return "fatal"
 
 
 # ---------------------------------------------------------------------------
 # @safe_llm_call decorator
 # ---------------------------------------------------------------------------
 
+_MAX_API_RETRIES = 3
+# Back-off schedule, indexed by attempt number (attempt 1 → 2 s, …).
+_WAITS = (2, 4, 8)
+
+
+def _llm_retry_loop(func, args, kwargs):
+    """
+    Retry engine behind :func:`safe_llm_call`.
+
+    Lives at module scope rather than nested in the decorator so every
+    decorated function shares one code object and its call sites stay
+    monomorphic — the closure only has to carry ``func``.
+    """
+    for attempt in range(1, _MAX_API_RETRIES + 1):
+        try:
+            _acquire_token()
+            result = func(*args, **kwargs)
+
+            # Guard: empty response
+            if result is None or (isinstance(result, str) and len(result.strip()) == 0):
+                raise ValueError("LLM returned an empty response.")
+
+            _throttle_up()
+            return result
+
+        except ValueError:
+            raise
+
+        except Exception as exc:
+            kind = _classify_error(exc)
+
+            # Rate-limit / quota / server-overload errors
+            if kind == "backoff":
+                _throttle_down()
+                wait = _WAITS[attempt - 1]
+                logger.warning(
+                    "Rate-limited (attempt %d/%d). Retrying in %ds …",
+                    attempt, _MAX_API_RETRIES, wait,
+                )
+                if attempt == _MAX_API_RETRIES:
+                    logger.error("Rate-limit retries exhausted.")
+                    raise
+                time.sleep(wait)
+
+            # Timeout errors
+            elif kind == "timeout":
+                logger.warning(
+                    "API timeout (attempt %d/%d). Retrying in 5 s …",
+                    attempt, _MAX_API_RETRIES,
+                )
+                if attempt == _MAX_API_RETRIES:
+                    logger.error("Timeout retries exhausted.")
+                    raise
+                time.sleep(5)
+
+            # All other errors — log and re-raise immediately
+            else:
+                logger.error("API error: %s", exc)
+                raise
+
+
+async def _allm_retry_loop(func, args, kwargs):
+    """Async counterpart of :func:`_llm_retry_loop` (non-blocking sleeps)."""
+    for attempt in range(1, _MAX_API_RETRIES + 1):
+        try:
+            # to_thread: the token wait must not block the event loop.
+            await asyncio.to_thread(_acquire_token)
+            result = await func(*args, **kwargs)
+
+            # Guard: empty response
+            if result is None or (isinstance(result, str) and len(result.strip()) == 0):
+                raise ValueError("LLM returned an empty response.")
+
+            _throttle_up()
+            return result
+
+        except ValueError:
+            raise
+
+        except Exception as exc:
+            kind = _classify_error(exc)
+
+            # Rate-limit / quota / server-overload errors
+            if kind == "backoff":
+                _throttle_down()
+                wait = _WAITS[attempt - 1]
+                logger.warning(
+                    "Rate-limited (attempt %d/%d). Retrying in %ds …",
+                    attempt, _MAX_API_RETRIES, wait,
+                )
+                if attempt == _MAX_API_RETRIES:
+                    logger.error("Rate-limit retries exhausted.")
+                    raise
+                await asyncio.sleep(wait)
+
+            # Timeout errors
+            elif kind == "timeout":
+                logger.warning(
+                    "API timeout (attempt %d/%d). Retrying in 5 s …",
+                    attempt, _MAX_API_RETRIES,
+                )
+                if attempt == _MAX_API_RETRIES:
+                    logger.error("Timeout retries exhausted.")
+                    raise
+                await asyncio.sleep(5)
+
+            # All other errors — log and re-raise immediately
+            else:
+                logger.error("API error: %s", exc)
+                raise
+
+
 def safe_llm_call(func):
     """
     Decorator that wraps any function making Gemini API calls with:
-    * Rate-limit (429)    → exponential back-off (2ˣ s, max 3 retries)
+    * Rate-limit (429)    → exponential back-off (2 / 4 / 8 s, max 3 retries)
     * Timeout / Deadline  → single retry after 5 s
     * Other API errors    → log and re-raise
     * Empty response      → raise ValueError
+
+    Works on both plain and coroutine functions: async callables get the
+    non-blocking retry loop (``await asyncio.sleep`` back-off), so one
+    decorator serves every call path.
     """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def awrapper(*args, **kwargs):
+            return await _allm_retry_loop(func, args, kwargs)
+
+        return awrapper
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        max_api_retries = 3
-        for attempt in range(1, max_api_retries + 1):
-            try:
-                result = func(*args, **kwargs)
+        return _llm_retry_loop(func, args, kwargs)
+
+    return wrapper
 
-                # Guard: empty response
-                if result is None or (isinstance(result, str) and len(result.strip()) == 0):
-                    raise ValueError("LLM returned an empty response.")
 
-                return result
+# ---------------------------------------------------------------------------
+# Server-side prompt caching (Gemini cached_content)
+# ---------------------------------------------------------------------------
+#
+# The four system prompts are static and re-sent on every call (and every
+# retry).  Caching them server-side cuts the cached portion of input-token
+# cost and latency.  Caches are created lazily per agent and refreshed
+# shortly before their TTL expires.
 
-            except ValueError:
-                raise
+# agent_name → (cache name or None, monotonic expiry)
+_prompt_caches: dict[str, tuple[str | None, float]] = {}
 
-            except Exception as exc:
-                exc_str = str(exc).lower()
-
-                # Rate-limit / quota / server-overload errors
-                if any(kw in exc_str for kw in ("429", "resource", "rate", "quota", "exhausted", "503", "500", "unavailable", "server error", "overloaded")):
-                    wait = 2 ** attempt
-                    logger.warning(
-                        "Rate-limited (attempt %d/%d). Retrying in %ds …",
-                        attempt, max_api_retries, wait,
-                    )
-                    if attempt == max_api_retries:
-                        logger.error("Rate-limit retries exhausted.")
-                        raise
-                    time.sleep(wait)
-
-                # Timeout errors
-                elif any(kw in exc_str for kw in ("timeout", "deadline", "timed out")):
-                    logger.warning(
-                        "API timeout (attempt %d/%d). Retrying in 5 s …",
-                        attempt, max_api_retries,
-                    )
-                    if attempt == max_api_retries:
-                        logger.error("Timeout retries exhausted.")
-                        raise
-                    time.sleep(5)
-
-                # All other errors — log and re-raise immediately
-                else:
-                    logger.error("API error: %s", exc)
-                    raise
 
-    return wrapper
+def _get_cached_content(agent_name: str, model: str, system_prompt: str) -> str | None:
+    """
+    Return the server-side cache name for this agent's system prompt,
+    creating/refreshing it as needed.  Returns None when caching is
+    disabled or unavailable (e.g. prompt below the model's minimum
+    token count), in which case the caller sends the prompt inline.
+    """
+    if not PROMPT_CACHE_ENABLED:
+        return None
+
+    now = time.monotonic()
+    entry = _prompt_caches.get(agent_name)
+    if entry is not None and now < entry[1]:
+        return entry[0]
+
+    name: str | None = None
+    try:
+        cache = get_client().caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                system_instruction=system_prompt,
+                ttl=f"{PROMPT_CACHE_TTL_S}s",
+            ),
+        )
+        name = cache.name
+        logger.info("Created prompt cache for %s: %s", agent_name, name)
+    except Exception as exc:
+        logger.debug("Prompt cache unavailable for %s: %s", agent_name, exc)
+
+    # Refresh 30 s before the server-side TTL actually lapses; a failed
+    # create is also remembered so we don't retry on every single call.
+    _prompt_caches[agent_name] = (name, now + PROMPT_CACHE_TTL_S - 30)
+    return name
+
+
+def _build_generation_config(
+    agent_name: str,
+    system_prompt: str,
+) -> "types.GenerateContentConfig":
+    """Build the per-agent GenerateContentConfig, using a cached system prompt when possible."""
+    cfg = AGENT_CFG[agent_name]
+    cached_name = _get_cached_content(agent_name, cfg.model, system_prompt)
+
+    kwargs = dict(
+        temperature=cfg.temperature,
+        max_output_tokens=cfg.max_output_tokens,
+        top_p=cfg.top_p,
+        top_k=cfg.top_k,
+    )
+    if cached_name:
+        kwargs["cached_content"] = cached_name
+    else:
+        kwargs["system_instruction"] = system_prompt
+    return types.GenerateContentConfig(**kwargs)
 
 
 # ---------------------------------------------------------------------------
 # Convenience caller
 # ---------------------------------------------------------------------------
 
+def _log_request(agent_name: str, cfg: "AgentCfg", note: str = "") -> None:
+    """Log an outbound call. Gated so suppressed levels cost one bool check."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Calling %s%s  model=%s  temp=%s  max_tokens=%d",
+            agent_name, note, cfg.model, cfg.temperature,
+            cfg.max_output_tokens,
+        )
+
+
+def _log_response(agent_name: str, text: str, note: str = "") -> None:
+    """Log a response; len(text) is only computed when INFO is enabled."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s responded — %d chars%s.", agent_name, len(text), note)
+
 @safe_llm_call
 def call_llm(
     agent_name: str,
     system_prompt: str,
     user_message: str,
+    cache: bool = True,
 ) -> str:
     """
     Make a single Google Gemini API call for the given agent.
@@ -123,6 +421,9 @@ def call_llm(
         The system-level instruction for the agent.
     user_message : str
         The user-facing prompt / context.
+    cache : bool
+        Allow serving/storing this response via the persistent response
+        cache (only active when LLM_CACHE is enabled in config).
 
     Returns
     -------
@@ -130,33 +431,206 @@ def call_llm(
         The model's text response.
     """
     client = get_client()
-    cfg = MODEL_CONFIG[agent_name]
+    cfg = AGENT_CFG[agent_name]
 
-    model = cfg["model"]
-    temperature = cfg["temperature"]
-    max_output_tokens = cfg["max_output_tokens"]
-    top_p = cfg.get("top_p", 0.9)
-    top_k = cfg.get("top_k", 40)
+    model = cfg.model
 
-    logger.info(
-        "Calling %s  model=%s  temp=%s  max_tokens=%d",
-        agent_name, model, temperature, max_output_tokens,
-    )
+    cache_key = None
+    if cache and response_cache.enabled(cfg.temperature):
+        cache_key = response_cache.response_key(
+            agent_name, model, system_prompt, user_message
+        )
+        hit = response_cache.lookup(cache_key)
+        if hit is not None:
+            logger.info("%s served from response cache.", agent_name)
+            return hit
+
+    _log_request(agent_name, cfg)
 
     response = client.models.generate_content(
         model=model,
         contents=user_message,
-        config=types.GenerateContentConfig(
-            system_instruction=system_prompt,
-            temperature=temperature,
-            max_output_tokens=max_output_tokens,
-            top_p=top_p,
-            top_k=top_k,
-        ),
+        config=_build_generation_config(agent_name, system_prompt),
     )
 
     text = response.text
-    logger.info(
-        "%s responded — %d chars.", agent_name, len(text),
+    _log_response(agent_name, text)
+    if cache_key is not None and text:
+        response_cache.store(cache_key, text)
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Batch API (offline / bulk builds)
+# ---------------------------------------------------------------------------
+
+# Terminal states for a Gemini batch job
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+def call_llm_batch(
+    jobs: list[dict],
+    poll_interval: float = 30.0,
+    timeout: float = 3600.0,
+) -> list[str]:
+    """
+    Run many LLM requests through the Gemini batch API.
+
+    Batch jobs are billed at half the interactive rate but complete
+    asynchronously (minutes rather than seconds), so this is only
+    suitable for offline/bulk generation — never the interactive CLI.
+
+    Parameters
+    ----------
+    jobs : list of dict
+        Each with ``agent_name``, ``system_prompt``, ``user_message``
+        keys, mirroring the :func:`call_llm` signature.
+    poll_interval : float
+        Seconds between job-status polls.
+    timeout : float
+        Maximum seconds to wait for each batch to finish.
+
+    Returns
+    -------
+    list of str
+        Model responses, in the same order as *jobs*.
+    """
+    client = get_client()
+    results: list[str | None] = [None] * len(jobs)
+
+    # One batch per model — every request in a batch shares the model.
+    by_model: dict[str, list[int]] = {}
+    for i, job in enumerate(jobs):
+        model = AGENT_CFG[job["agent_name"]].model
+        by_model.setdefault(model, []).append(i)
+
+    for model, indices in by_model.items():
+        src = []
+        for i in indices:
+            job = jobs[i]
+            cfg = AGENT_CFG[job["agent_name"]]
+            src.append({
+                "contents": [
+                    {"role": "user", "parts": [{"text": job["user_message"]}]}
+                ],
+                "config": {
+                    "system_instruction": job["system_prompt"],
+                    "temperature": cfg.temperature,
+                    "max_output_tokens": cfg.max_output_tokens,
+                },
+            })
+
+        batch = client.batches.create(model=model, src=src)
+        logger.info(
+            "Submitted batch %s — %d request(s), model=%s",
+            batch.name, len(src), model,
+        )
+
+        deadline = time.monotonic() + timeout
+        while batch.state.name not in _BATCH_DONE_STATES:
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Batch {batch.name} did not finish within {timeout}s"
+                )
+            time.sleep(poll_interval)
+            batch = client.batches.get(name=batch.name)
+
+        if batch.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(
+                f"Batch {batch.name} ended in state {batch.state.name}"
+            )
+
+        for i, inlined in zip(indices, batch.dest.inlined_responses):
+            if inlined.response is None:
+                raise RuntimeError(
+                    f"Batch request for job {i} failed: {inlined.error}"
+                )
+            results[i] = inlined.response.text
+
+    return results
+
+
+@safe_llm_call
+async def acall_llm_stream(
+    agent_name: str,
+    system_prompt: str,
+    user_message: str,
+    on_chunk=None,
+) -> str:
+    """
+    Streaming variant of :func:`acall_llm`.
+
+    Returns the full accumulated text, but invokes *on_chunk* with each
+    text delta as it arrives, so callers can begin parsing or updating
+    the UI while the model is still decoding.
+    """
+    aio = get_async_client()
+    cfg = AGENT_CFG[agent_name]
+
+    _log_request(agent_name, cfg, note=" (stream)")
+
+    parts: list[str] = []
+    stream = await aio.models.generate_content_stream(
+        model=cfg.model,
+        contents=user_message,
+        config=_build_generation_config(agent_name, system_prompt),
     )
+    async for chunk in stream:
+        delta = chunk.text
+        if not delta:
+            continue
+        parts.append(delta)
+        if on_chunk is not None:
+            on_chunk(delta)
+
+    text = "".join(parts)
+    _log_response(agent_name, text, note=" (streamed)")
+    return text
+
+
+@safe_llm_call
+async def acall_llm(
+    agent_name: str,
+    system_prompt: str,
+    user_message: str,
+    cache: bool = True,
+) -> str:
+    """
+    Async variant of :func:`call_llm` using the GenAI async client.
+
+    Awaiting here instead of blocking lets the orchestrator overlap
+    several agent calls (e.g. batch builds) on one event loop.
+    """
+    aio = get_async_client()
+    cfg = AGENT_CFG[agent_name]
+
+    model = cfg.model
+
+    cache_key = None
+    if cache and response_cache.enabled(cfg.temperature):
+        cache_key = response_cache.response_key(
+            agent_name, model, system_prompt, user_message
+        )
+        hit = await asyncio.to_thread(response_cache.lookup, cache_key)
+        if hit is not None:
+            logger.info("%s served from response cache.", agent_name)
+            return hit
+
+    _log_request(agent_name, cfg, note=" (async)")
+
+    response = await aio.models.generate_content(
+        model=model,
+        contents=user_message,
+        config=_build_generation_config(agent_name, system_prompt),
+    )
+
+    text = response.text
+    _log_response(agent_name, text)
+    if cache_key is not None and text:
+        await asyncio.to_thread(response_cache.store, cache_key, text)
     return text
@@ -0,0 +1,84 @@
+"""
+Agentic Game-Builder AI — Persistent LLM Response Cache
+
+Disk-backed memoisation of LLM responses, keyed by a BLAKE2b digest of
+the full request (agent, model, system prompt, user message).  Repeated
+runs with identical inputs — most commonly executor retries whose plan
+and previous validation issues are unchanged — are served from disk in
+milliseconds instead of paying a fresh 10-30 s inference round-trip.
+
+Cached responses are only safe to replay when the sampling is (near-)
+deterministic, so the cache is opt-in via the ``LLM_CACHE`` environment
+variable (see config.py) — except for agents configured with
+``temperature == 0.0``, whose output is deterministic by definition and
+is therefore always cacheable.
+"""
+
+import hashlib
+import logging
+import os
+import shelve
+import threading
+
+from config import LLM_CACHE_DIR, LLM_CACHE_ENABLED
+
+logger = logging.getLogger(__name__)
+
+# shelve handles are not thread-safe; serialise access so the sync
+# pipeline and asyncio.to_thread callers never corrupt the store.
+_lock = threading.Lock()
+
+
+def _store_path() -> str:
+    """Path of the shelve store, creating the cache directory on demand."""
+    os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+    return os.path.join(LLM_CACHE_DIR, "responses")
+
+
+def enabled(temperature: float | None = None) -> bool:
+    """
+    Whether response caching applies to a call.
+
+    True when the process-wide opt-in is set, or when the caller's
+    sampling *temperature* is exactly 0.0 — a deterministic call always
+    returns the same text, so replaying it is free speed-up, not a
+    behaviour change.
+    """
+    return LLM_CACHE_ENABLED or temperature == 0.0
+
+
+def response_key(
+    agent_name: str,
+    model: str,
+    system_prompt: str,
+    user_message: str,
+) -> str:
+    """Stable BLAKE2b digest identifying one exact LLM request."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in (agent_name, model, system_prompt, user_message):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")  # field separator — avoids boundary collisions
+    return h.hexdigest()
+
+
+def lookup(key: str) -> str | None:
+    """Return the cached response for *key*, or None on miss/error."""
+    with _lock:
+        try:
+            with shelve.open(_store_path()) as store:
+                return store.get(key)
+        except Exception as exc:
+            logger.debug("Response cache lookup failed: %s", exc)
+            return None
+
+
+def store(key: str, response: str) -> None:
+    """Persist *response* under *key*; failures are logged, never raised."""
+    if not response:
+        return
+    with _lock:
+        try:
+            with shelve.open(_store_path()) as store:
+                store[key] = response
+        except Exception as exc:
+            logger.debug("Response cache store failed: %s", exc)
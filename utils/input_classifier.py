@@ -0,0 +1,67 @@
+"""
+Agentic Game-Builder AI — Fast Input Classifier
+
+Local heuristic fast-path for the clarifier phase: when the user's raw
+idea already names a game type, a core action, and a win/score notion,
+the requirements can be filled in directly without paying a 5-15 s LLM
+round-trip.  Anything ambiguous returns None and falls through to the
+clarifier agent as before.
+"""
+
+import logging
+import re
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import — each call is three or four regex scans over
+# a short input string.
+_GAME_TYPE_RE = re.compile(
+    r"\b(platformer|shooter|puzzle|arcade|racing|snake|pong|breakout|"
+    r"tetris|match-?3|memory|maze|tower defen[cs]e)\b",
+    re.IGNORECASE,
+)
+_ACTION_RE = re.compile(
+    r"\b(jump|shoot|match|navigate|dodge|collect|stack|race|fly|slide|"
+    r"eat|catch|avoid|climb)\b",
+    re.IGNORECASE,
+)
+_WIN_RE = re.compile(
+    r"\b(win|lose|score|points?|survive|high[ -]?score|reach|clear|"
+    r"complete|beat)\b",
+    re.IGNORECASE,
+)
+_CONTROL_RE = re.compile(
+    r"\b(arrow keys?|wasd|keyboard|mouse|click|touch|space ?bar)\b",
+    re.IGNORECASE,
+)
+
+
+def try_fast_classify(text: str) -> Optional[Dict]:
+    """
+    Attempt to derive clarifier requirements from *text* locally.
+
+    Returns a requirements dict matching the clarifier's schema when the
+    input already pins down game type, core action, and win condition;
+    otherwise None.  Fields the input doesn't specify are filled with
+    "Agent will decide", mirroring the clarifier's vague-answer rule.
+    """
+    type_match = _GAME_TYPE_RE.search(text)
+    action_match = _ACTION_RE.search(text)
+    win_match = _WIN_RE.search(text)
+    if not (type_match and action_match and win_match):
+        return None
+
+    control_match = _CONTROL_RE.search(text)
+    logger.info("Input classified locally — skipping the clarifier LLM call.")
+    return {
+        "game_type": type_match.group(1).lower(),
+        "core_mechanic": action_match.group(1).lower(),
+        "win_condition": win_match.group(1).lower(),
+        "lose_condition": "Agent will decide",
+        "control_scheme": (
+            control_match.group(1).lower() if control_match else "Agent will decide"
+        ),
+        "visual_style": "Agent will decide",
+        "additional_features": [],
+    }
@@ -0,0 +1,50 @@
+"""
+Agentic Game-Builder AI — JSON Extraction Utility
+
+Finds the first *balanced* JSON object embedded in LLM output.  The old
+``text.find("{")`` / ``text.rfind("}")`` fallback breaks whenever the
+model appends prose containing a stray ``}`` — this scanner tracks brace
+depth and string/escape state in a single linear pass instead.
+"""
+
+from typing import Optional
+
+
+def extract_first_json(s: str) -> Optional[str]:
+    """
+    Return the first balanced ``{...}`` object found in *s*, or None.
+
+    Braces inside JSON strings (and escaped quotes inside those strings)
+    are ignored, so trailing commentary containing ``}`` cannot corrupt
+    the extraction the way a blind ``rfind("}")`` slice could.
+    """
+    start = s.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(s)):
+        ch = s[i]
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+
+    return None
@@ -0,0 +1,31 @@
+"""
+Agentic Game-Builder AI — Shared Response-Parsing Helpers
+
+Markdown fence stripping used by every JSON-returning agent.
+"""
+
+import re
+
+# Fallback for irregular fences (stray or mid-text fence lines)
+_FENCE_LINE_RE = re.compile(r"^[ \t]*```.*\n?", re.MULTILINE)
+
+
+def strip_fences(text: str) -> str:
+    """
+    Remove markdown code fences wrapping *text*.
+
+    Fast path: the common LLM output is an exact ```json … ``` wrapper,
+    handled with two splits and no intermediate line list.  Anything
+    more irregular falls back to a precompiled fence-line regex.
+    """
+    if not text.startswith("```"):
+        return text
+
+    if text.endswith("```"):
+        head = text.split("\n", 1)
+        if len(head) == 2:
+            body = head[1].rsplit("\n", 1)
+            if len(body) == 2 and body[1].strip() == "```":
+                return body[0]
+
+    return _FENCE_LINE_RE.sub("", text)
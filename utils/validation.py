@@ -7,7 +7,9 @@ Validator agent runs.  These are cheap, deterministic, and fast.
 
 import logging
 import re
-from typing import Tuple, List
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, Tuple, List
 
 logger = logging.getLogger(__name__)
 
@@ -16,19 +18,44 @@ logger = logging.getLogger(__name__)
 # Robust markdown code-block extraction (regex, NOT string splitting)
 # ---------------------------------------------------------------------------
 
+# The block body is matched with an unambiguous character class — each
+# position is either a non-backtick or a backtick that does not open a
+# closing fence — so the engine runs in a single forward pass.  The old
+# lazy ``.*?`` could re-scan O(N) positions on input with an unmatched
+# opening fence (truncated LLM output is exactly that shape).
 _CODE_BLOCK_RE = re.compile(
-    r"```(?:html|css|javascript|js)?\s*\n(.*?)```",
-    re.DOTALL | re.IGNORECASE,
+    r"```(?:html|css|javascript|js)?[ \t]*\n((?:[^`]|`(?!``))*)```",
+    re.IGNORECASE,
 )
 
 
+@lru_cache(maxsize=64)
+def _extract_code_blocks_cached(text: str) -> tuple:
+    return tuple(_CODE_BLOCK_RE.findall(text))
+
+
 def extract_code_blocks(text: str) -> List[str]:
     """
     Extract all fenced code blocks from LLM markdown output.
 
     Uses a robust regex pattern — never simple ``.split("```")``.
+    Results are memoised: the same response text is parsed by the
+    executor and then re-checked during validation/retry, so repeat
+    calls are dictionary lookups.
+    """
+    return list(_extract_code_blocks_cached(text))
+
+
+def iter_code_blocks(text: str) -> Iterator[str]:
+    """
+    Lazily yield fenced code blocks from LLM markdown output.
+
+    Backed by ``finditer``, so callers that stop early (e.g. once every
+    target file has been classified) never materialise the remaining
+    blocks of a large response.
     """
-    return _CODE_BLOCK_RE.findall(text)
+    for m in _CODE_BLOCK_RE.finditer(text):
+        yield m.group(1)
 
 
 # ---------------------------------------------------------------------------
@@ -39,12 +66,99 @@ _INCOMPLETE_PATTERNS = [
     r"\bTODO\b",
     r"\bFIXME\b",
     r"PLACEHOLDER",
-    r"//\s*add\s+(logic|code|implementation)\s+here",  # "add logic here" only
-    r"//\s*implement\s+(this|later|here)",              # "implement later" only
-    r"function\s+\w+\s*\(\s*\)\s*\{\s*\}",             # empty function body
-    r"=>\s*\{\s*\}",                                    # empty arrow function
+    r"//\s*add\s+(?:logic|code|implementation)\s+here",  # "add logic here" only
+    r"//\s*implement\s+(?:this|later|here)",              # "implement later" only
 ]
 
+# All patterns unioned into a single alternation compiled at import, so
+# each call scans the code once instead of once per pattern.  The named
+# groups (p0, p1, …) map every hit back to its source pattern.
+_INCOMPLETE_RE = re.compile(
+    "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(_INCOMPLETE_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Every pattern above requires one of these literals, so input that
+# contains none of them skips the regex engine entirely — ``in`` on str
+# is a much faster C-level scan.
+_COMPLETENESS_NEEDLES = (
+    "todo", "fixme", "placeholder", "add", "implement",
+)
+
+
+def _preceded_by_fn(code: str, i: int) -> bool:
+    """True if ``code[:i]`` ends in a no-arg function header or an arrow."""
+    j = i - 1
+    while j >= 0 and code[j].isspace():
+        j -= 1
+    if j >= 0 and code[j] == ">":
+        # "=> {}" — empty arrow function, any parameter list.
+        return j > 0 and code[j - 1] == "="
+    # "function name() {}" — walk back over ')', '(', identifier.
+    if j < 0 or code[j] != ")":
+        return False
+    j -= 1
+    while j >= 0 and code[j].isspace():
+        j -= 1
+    if j < 0 or code[j] != "(":
+        return False
+    j -= 1
+    while j >= 0 and code[j].isspace():
+        j -= 1
+    end = j
+    while j >= 0 and (code[j].isalnum() or code[j] in "_$"):
+        j -= 1
+    if j == end:  # anonymous — the old pattern required a name
+        return False
+    while j >= 0 and code[j].isspace():
+        j -= 1
+    return j >= 7 and code[j - 7:j + 1] == "function"
+
+
+def _has_empty_body(code: str) -> bool:
+    """
+    Structural scan for empty function bodies.
+
+    Finds each "{" with str.find (memchr under the hood), checks that
+    only whitespace separates it from its "}", then confirms the
+    preceding context is a function header or arrow.  Same semantics as
+    the regex patterns it replaced, without the whitespace-gap
+    backtracking.
+    """
+    i = code.find("{")
+    n = len(code)
+    while i != -1:
+        j = i + 1
+        while j < n and code[j].isspace():
+            j += 1
+        if j < n and code[j] == "}" and _preceded_by_fn(code, i):
+            return True
+        i = code.find("{", i + 1)
+    return False
+
+
+@lru_cache(maxsize=64)
+def _check_completeness_cached(code: str) -> Tuple[bool, tuple]:
+    issues: List[str] = []
+
+    low = code.lower()
+    if any(needle in low for needle in _COMPLETENESS_NEEDLES):
+        hits: dict[str, List[str]] = {}
+        for m in _INCOMPLETE_RE.finditer(code):
+            hits.setdefault(m.lastgroup, []).append(m.group())
+        issues.extend(
+            f"Found incomplete pattern '{_INCOMPLETE_PATTERNS[int(name[1:])]}': "
+            f"{matches[:3]}"
+            for name, matches in sorted(
+                hits.items(), key=lambda kv: int(kv[0][1:])
+            )
+        )
+
+    if _has_empty_body(code):
+        issues.append("Found empty function body")
+
+    return (len(issues) == 0, tuple(issues))
+
 
 def check_completeness(code: str) -> Tuple[bool, List[str]]:
     """
@@ -54,11 +168,33 @@ def check_completeness(code: str) -> Tuple[bool, List[str]]:
     -------
     (is_complete, issues)
     """
+    ok, issues = _check_completeness_cached(code)
+    return (ok, list(issues))
+
+
+# ---------------------------------------------------------------------------
+# Brace balance (cheap syntax sanity)
+# ---------------------------------------------------------------------------
+
+def check_brace_balance(code: str) -> Tuple[bool, List[str]]:
+    """
+    Verify that ``{}``, ``()``, and ``[]`` counts balance out.
+
+    A pure counter, not a parser: delimiters inside strings or comments
+    can in principle skew it, but generated game code almost never does
+    that asymmetrically, and an imbalance is a near-certain sign of
+    truncated or malformed output.
+    """
     issues: List[str] = []
-    for pattern in _INCOMPLETE_PATTERNS:
-        matches = re.findall(pattern, code, re.IGNORECASE)
-        if matches:
-            issues.append(f"Found incomplete pattern '{pattern}': {matches[:3]}")
+    for open_ch, close_ch, label in (
+        ("{", "}", "braces"),
+        ("(", ")", "parentheses"),
+        ("[", "]", "brackets"),
+    ):
+        delta = code.count(open_ch) - code.count(close_ch)
+        if delta:
+            kind = "unclosed" if delta > 0 else "extra closing"
+            issues.append(f"Mismatched {label}: {abs(delta)} {kind}")
 
     return (len(issues) == 0, issues)
 
@@ -67,42 +203,76 @@ def check_completeness(code: str) -> Tuple[bool, List[str]]:
 # HTML structure validation
 # ---------------------------------------------------------------------------
 
-def validate_html_structure(html: str) -> Tuple[bool, List[str]]:
-    """Check that the HTML file has the essential boilerplate."""
-    issues: List[str] = []
+# All boilerplate needles in one case-insensitive alternation: one scan
+# of the document replaces several substring passes over html.lower()
+# copies.
+_HTML_FLAGS_RE = re.compile(
+    r"(?P<doctype><!doctype\s+html)"
+    r"|(?P<canvas><canvas)"
+    r"|(?P<phaser>phaser)"
+    r"|(?P<script><script)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=64)
+def _validate_html_cached(html: str) -> Tuple[bool, tuple]:
+    seen = set()
+    for m in _HTML_FLAGS_RE.finditer(html):
+        seen.add(m.lastgroup)
+        if len(seen) == 4:
+            break
 
-    if "<!DOCTYPE html>" not in html and "<!doctype html>" not in html:
+    issues: List[str] = []
+    if "doctype" not in seen:
         issues.append("Missing <!DOCTYPE html>")
-    if "<canvas" not in html.lower() and "phaser" not in html.lower():
+    if "canvas" not in seen and "phaser" not in seen:
         issues.append("Missing <canvas> element (or Phaser container)")
-    if "<script" not in html.lower():
+    if "script" not in seen:
         issues.append("Missing <script> tag")
 
-    return (len(issues) == 0, issues)
+    return (len(issues) == 0, tuple(issues))
+
+
+def validate_html_structure(html: str) -> Tuple[bool, List[str]]:
+    """Check that the HTML file has the essential boilerplate."""
+    ok, issues = _validate_html_cached(html)
+    return (ok, list(issues))
 
 
 # ---------------------------------------------------------------------------
 # JS structure validation
 # ---------------------------------------------------------------------------
 
-def validate_js_structure(js: str) -> Tuple[bool, List[str]]:
-    """Check that game.js contains the minimum expected constructs."""
-    issues: List[str] = []
+# Game-loop and input-handling tokens in one alternation — a single
+# scan instead of up to seven substring/regex passes per file.
+_JS_TOKENS_RE = re.compile(
+    r"(?P<loop>requestAnimationFrame|setInterval|function\s+update\s*\(|Phaser\.Game)"
+    r"|(?P<events>addEventListener|this\.input|cursors)"
+)
 
-    has_game_loop = (
-        "requestAnimationFrame" in js
-        or "setInterval" in js
-        or re.search(r"function\s+update\s*\(", js) is not None
-        or "Phaser.Game" in js
-    )
-    if not has_game_loop:
-        issues.append("No game loop detected (requestAnimationFrame / update / Phaser)")
 
-    has_events = "addEventListener" in js or "this.input" in js or "cursors" in js
-    if not has_events:
+@lru_cache(maxsize=64)
+def _validate_js_cached(js: str) -> Tuple[bool, tuple]:
+    seen = set()
+    for m in _JS_TOKENS_RE.finditer(js):
+        seen.add(m.lastgroup)
+        if len(seen) == 2:
+            break
+
+    issues: List[str] = []
+    if "loop" not in seen:
+        issues.append("No game loop detected (requestAnimationFrame / update / Phaser)")
+    if "events" not in seen:
         issues.append("No input event listeners detected")
 
-    return (len(issues) == 0, issues)
+    return (len(issues) == 0, tuple(issues))
+
+
+def validate_js_structure(js: str) -> Tuple[bool, List[str]]:
+    """Check that game.js contains the minimum expected constructs."""
+    ok, issues = _validate_js_cached(js)
+    return (ok, list(issues))
 
 
 # ---------------------------------------------------------------------------
@@ -116,16 +286,20 @@ def check_framework_consistency(
 ) -> Tuple[bool, List[str]]:
     """Ensure plan-specified framework matches the generated code."""
     issues: List[str] = []
-    framework = ""
 
-    if isinstance(plan, dict):
-        tech = plan.get("technical_architecture", {})
-        choice = tech.get("framework_choice", {})
-        framework = choice.get("selected", "").lower()
-        if not framework:
-            # fallback: check metadata
-            metadata = plan.get("metadata", {})
-            framework = metadata.get("framework", "").lower()
+    # Index the happy path directly — the planner schema nests the
+    # selection three levels deep, and chained .get(..., {}) allocates a
+    # throwaway dict per level.  Any shape problem (missing key, plan
+    # not a dict, non-string leaf) lands in the except and falls back.
+    try:
+        framework = plan["technical_architecture"]["framework_choice"]["selected"].lower()
+    except (KeyError, TypeError, AttributeError):
+        framework = ""
+    if not framework:
+        try:
+            framework = plan["metadata"]["framework"].lower()
+        except (KeyError, TypeError, AttributeError):
+            framework = ""
 
     if "phaser" in framework:
         if "Phaser" not in js and "phaser" not in html.lower():
@@ -141,6 +315,18 @@ def check_framework_consistency(
 # Aggregate validation
 # ---------------------------------------------------------------------------
 
+def _has_min_content(content: str, n: int = 100) -> bool:
+    """
+    True if *content* holds at least *n* non-whitespace characters.
+
+    Counts lazily and stops at *n*, so a multi-KB file is confirmed
+    after its first ~n characters — no full stripped copy is allocated
+    just to take its length.
+    """
+    nonspace = (ch for ch in content if not ch.isspace())
+    return sum(1 for _ in islice(nonspace, n)) >= n
+
+
 def run_all_checks(
     files: dict[str, str],
     plan: dict | None = None,
@@ -148,38 +334,50 @@ def run_all_checks(
     """Run every structural check and return aggregated results."""
     all_issues: List[str] = []
 
-    # File presence
+    # File presence — emptiness is checked without a .strip() copy
     for required in ("index.html", "style.css", "game.js"):
-        if required not in files or not files[required].strip():
+        content = files.get(required)
+        if not content or content.isspace():
             all_issues.append(f"Missing or empty file: {required}")
 
     if all_issues:
         return False, all_issues
 
+    # Every section below references these three files — pay the dict
+    # lookups once instead of on each check.
+    html = files["index.html"]
+    css = files["style.css"]
+    js = files["game.js"]
+
     # Minimum code length
     for fname, content in files.items():
-        if len(content.strip()) < 100:
+        if not _has_min_content(content):
             all_issues.append(f"{fname} is suspiciously short ({len(content)} chars)")
 
-    # Completeness
-    for fname in ("index.html", "game.js"):
-        ok, issues = check_completeness(files[fname])
-        if not ok:
-            all_issues.extend([f"[{fname}] {i}" for i in issues])
+    # Completeness + brace balance — one pass over each file
+    for fname, content, checks in (
+        ("index.html", html, (check_completeness,)),
+        ("style.css", css, (check_brace_balance,)),
+        ("game.js", js, (check_completeness, check_brace_balance)),
+    ):
+        for check in checks:
+            ok, issues = check(content)
+            if not ok:
+                all_issues.extend(f"[{fname}] {i}" for i in issues)
 
     # HTML structure
-    ok, issues = validate_html_structure(files["index.html"])
+    ok, issues = validate_html_structure(html)
     if not ok:
-        all_issues.extend([f"[index.html] {i}" for i in issues])
+        all_issues.extend(f"[index.html] {i}" for i in issues)
 
     # JS structure
-    ok, issues = validate_js_structure(files["game.js"])
+    ok, issues = validate_js_structure(js)
     if not ok:
-        all_issues.extend([f"[game.js] {i}" for i in issues])
+        all_issues.extend(f"[game.js] {i}" for i in issues)
 
     # Framework consistency
     if plan:
-        ok, issues = check_framework_consistency(plan, files["index.html"], files["game.js"])
+        ok, issues = check_framework_consistency(plan, html, js)
         if not ok:
             all_issues.extend(issues)
 